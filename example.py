@@ -32,20 +32,20 @@ def step(dt):
                            color=(180,180,180), speed=(0,170), lifetime=6)
         rocks.append(r)
 
-    # collisions (no None checks, just skip dead ones)
-    for r in rocks:
-        if not r.alive: 
-            continue
-        if r.rect.colliderect(player.rect):
-            playkit.game_over("You Lose!")
-        for b in bullets:
-            if not b.alive:
-                continue
-            if b.rect.colliderect(r.rect):
-                score += 1
-                r.destroy()
-                b.destroy()
-                break
+    # forget rocks and bullets that are gone
+    rocks[:]   = [r for r in rocks if r.alive]
+    bullets[:] = [b for b in bullets if b.alive]
+
+    # rock hits player = game over
+    if playkit.overlaps([player], rocks):
+        playkit.game_over("You Lose!")
+
+    # bullet hits rock = both disappear, +1 score
+    for r, b in playkit.overlaps(rocks, bullets):
+        if r.alive and b.alive:
+            score += 1
+            r.destroy()
+            b.destroy()
 
     playkit.write(f"Score: {score}", 10, 10, size=24)
 
@@ -1,13 +1,20 @@
 # playkit.py
 
+import math
+import numpy as np
 import pygame
 import sys
 
+try:
+    from numba import njit   # optional: compiles the physics pass
+except ImportError:
+    njit = None
+
 __all__ = [
     'start', 'sprite', 'when_key', 'when_click', 'when_update',
     'on_game_update', 'draw_circle', 'write',
     'on_game_start', 'game_over', 'control_arrows', 'projectile_from',
-    'when_overlap', 'platform', 'enable_gravity', 'set_background'
+    'when_overlap', 'overlaps', 'platform', 'enable_gravity', 'set_background'
 ]
 
 # ——— Game-over / restart system ———
@@ -28,8 +35,101 @@ def game_over(message):
 # ——— Overlap events ———
 _overlap_handlers = []
 def when_overlap(a, b, fn):
-    """Call fn(a,b) whenever two sprites overlap."""
-    _overlap_handlers.append((a, b, fn))
+    """
+    Call fn(a,b) whenever two sprites overlap.
+    a and b can also be lists (or sets, ...) of sprites, e.g. bullets and
+    rocks; then fn(a,b) runs for every touching pair, one sprite from each.
+    A sprite never overlaps itself, and with the same group twice, e.g.
+    when_overlap(balls, balls, bump), each touching pair runs once.
+    """
+    _overlap_handlers.append((_as_group(a), _as_group(b), fn))
+
+def _as_group(obj):
+    """Collections are kept (so sprites added later count); one sprite -> [sprite]."""
+    return [obj] if isinstance(obj, Sprite) else obj
+
+# ——— Group collisions ———
+_PAIR_LOOP_MAX = 64        # up to this many pairs, test them one by one
+_BROADCAST_MAX = 1 << 20   # up to this many pairs, test them all in NumPy
+_GRID_CELL     = 64        # past that, spatial-hash cell size (~2x a sprite)
+_grid          = {}
+
+def _rect_array(sprites):
+    """(N, 4) array of the sprites' rects as x, y, w, h."""
+    return np.array([s.rect for s in sprites], np.float64).reshape(-1, 4)
+
+def _touching(a, b):
+    """(N, M) bool matrix: rect a[i] overlaps rect b[j], as in colliderect."""
+    a_left, a_top, a_right, a_bottom = _edges(a[:, None, :])
+    b_left, b_top, b_right, b_bottom = _edges(b)
+    # OR together the ways two rects can be apart, in place into one matrix;
+    # empty rects never touch, so fold those in as tiny (N,1)/(M,) masks.
+    apart  = a_right <= b_left
+    apart |= a_left >= b_right
+    apart |= a_bottom <= b_top
+    apart |= a_top >= b_bottom
+    apart |= (a[:, 2:3] == 0) | (a[:, 3:4] == 0)
+    apart |= (b[:, 2] == 0) | (b[:, 3] == 0)
+    return np.logical_not(apart, out=apart)
+
+def _edges(rects):
+    """left, top, right, bottom of (..., 4) rects; negative sizes flip, as in pygame."""
+    x, y, w, h = np.moveaxis(rects, -1, 0)
+    return (np.minimum(x, x + w), np.minimum(y, y + h),
+            np.maximum(x, x + w), np.maximum(y, y + h))
+
+def _grid_cells(rect):
+    """Yield the (col, row) grid cells a rect covers."""
+    c = _GRID_CELL
+    left, right = sorted((rect.left, rect.right))   # negative sizes flip
+    top, bottom = sorted((rect.top, rect.bottom))
+    for row in range(top // c, (bottom - 1) // c + 1):
+        for col in range(left // c, (right - 1) // c + 1):
+            yield col, row
+
+def overlaps(group_a, group_b):
+    """
+    Return every (a, b) pair of live sprites, one from each group, that touch.
+    Pairs come in group order, e.g.:
+        for rock, bullet in overlaps(rocks, bullets): ...
+    A sprite is never paired with itself. Passing the same group twice,
+    overlaps(balls, balls), gives each touching pair once, as (earlier, later).
+    """
+    same   = group_a is group_b
+    live_a = [s for s in group_a if s.alive]
+    live_b = live_a if same else [s for s in group_b if s.alive]
+    return [(live_a[i], live_b[j]) for i, j in _overlap_indices(live_a, live_b)
+            if (i < j if same else live_a[i] is not live_b[j])]
+
+def _overlap_indices(live_a, live_b):
+    """(i, j) for every live_a[i] touching live_b[j], in order."""
+    pairs   = []
+    n_pairs = len(live_a) * len(live_b)
+    if n_pairs <= _PAIR_LOOP_MAX:
+        # One C-level collidelistall() per a instead of a colliderect() per pair.
+        rects_b = [b.rect for b in live_b]
+        for i, a in enumerate(live_a):
+            pairs.extend((i, j) for j in a.rect.collidelistall(rects_b))
+        return pairs
+
+    if n_pairs <= _BROADCAST_MAX:
+        # One vectorized test over every pair at once.
+        return np.argwhere(_touching(_rect_array(live_a), _rect_array(live_b))).tolist()
+
+    # Spatial hash: drop each b into the cells it covers, then test each a
+    # only against the b's that share one of its cells.
+    _grid.clear()
+    for j, b in enumerate(live_b):
+        for key in _grid_cells(b.rect):
+            _grid.setdefault(key, []).append(j)
+    for i, a in enumerate(live_a):
+        near = set()
+        for key in _grid_cells(a.rect):
+            near.update(_grid.get(key, ()))
+        near = sorted(near)
+        hits = a.rect.collidelistall([live_b[j].rect for j in near])
+        pairs.extend((i, near[k]) for k in hits)
+    return pairs
 
 # ——— Platforms & Gravity ———
 _platforms = []
@@ -49,12 +149,61 @@ _screen               = None
 _clock                = None
 _sprites              = []
 _key_handlers         = {}
+_key_handlers_flat    = []   # (code, fn) pairs, same order as _key_handlers
+_key_code_cache       = {}   # key name -> pygame key code
 _click_handlers       = {}
 _update_handlers      = []
 _game_update_handlers = []
 _draw_commands        = []
 _text_commands        = []
-_image_cache          = {}
+_raw_image_cache      = {}   # path -> converted, unscaled image
+_image_cache          = {}   # (path, width, height) -> scaled image
+_font_cache           = {}
+_color_surf_cache     = {}
+
+def _font(size):
+    """Default font at `size`, loaded once and reused."""
+    f = _font_cache.get(size)
+    if f is None:
+        f = pygame.font.Font(None, size)
+        _font_cache[size] = f
+    return f
+
+_TEXT_CACHE_MAX = 64
+_text_cache     = {}
+
+def _lru_get(cache, key, limit, make):
+    """cache[key], built with make() on a miss; keeps at most `limit` entries."""
+    value = cache.pop(key, None)   # re-inserted below as most recent
+    if value is None:
+        value = make()
+        if len(cache) >= limit:
+            del cache[next(iter(cache))]   # least recently used
+    cache[key] = value
+    return value
+
+def _normalize_color(color):
+    """Any pygame color (name, tuple, list, Color, mapped int) as an RGBA tuple."""
+    if isinstance(color, int):
+        return tuple(_screen.unmap_rgb(color))   # ints are pixels, as in draw.rect
+    return tuple(pygame.Color(color))
+
+def _text_surface(text, size, color=(255,255,255)):
+    """Rendered text, reused while the same string keeps being drawn."""
+    return _lru_get(_text_cache, (text, size, color),
+                    _TEXT_CACHE_MAX,
+                    lambda: _font(size).render(text, True, color))
+
+_COLOR_CACHE_MAX = 256
+
+def _color_surface(color, size):
+    """Solid surface for a colored-rectangle sprite, reused per color/size."""
+    rgba = _normalize_color(color)
+    def make():
+        surf = pygame.Surface(size).convert()
+        surf.fill(rgba)
+        return surf
+    return _lru_get(_color_surf_cache, (rgba, size), _COLOR_CACHE_MAX, make)
 
 # Background state
 _background_path   = None
@@ -62,22 +211,41 @@ _background_color  = (0, 0, 0)
 _background_mode   = 'stretch'   # 'stretch' or 'tile'
 _background_surface = None
 
+# Display updates
+_full_redraw     = True   # present the whole window on the next frame
+_DIRTY_RECTS_MAX = 500    # past this many changed rects, just flip()
+_REDRAW_EVENTS   = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,   # window was
+                    pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)  # uncovered/resized
+
 def _prepare_background(width, height):
     """Load/scale background surface after window exists."""
-    global _background_surface
+    global _background_surface, _full_redraw
     _background_surface = None
+    _full_redraw = True
     if _background_path:
         try:
             img = pygame.image.load(_background_path).convert()
             if _background_mode == 'stretch':
                 _background_surface = pygame.transform.smoothscale(img, (width, height))
             else:
-                # 'tile' mode uses the original image size; keep as-is
-                _background_surface = img
+                # 'tile': repeat the image once into a window-sized surface
+                bg = pygame.Surface((width, height)).convert()
+                iw, ih = img.get_size()
+                bg.blits([(img, (xx, yy)) for yy in range(0, height, ih)
+                                          for xx in range(0, width, iw)],
+                         doreturn=False)
+                _background_surface = bg
         except Exception:
             print(f'Oops! Can’t find "{_background_path}" for background. Using solid color instead.')
             _background_surface = None
 
+def _draw_background():
+    """Blit the (already window-sized) background, or fill with its color."""
+    if _background_surface:
+        _screen.blit(_background_surface, (0,0))
+    else:
+        _screen.fill(_background_color)
+
 def set_background(image_path=None, color=(0,0,0), mode='stretch'):
     """
     Set a background image or color.
@@ -95,6 +263,255 @@ def set_background(image_path=None, color=(0,0,0), mode='stretch'):
         w, h = _screen.get_size()
         _prepare_background(w, h)
 
+# ——— Physics arrays ———
+# Sprite physics state lives in parallel arrays (one row per sprite) so the
+# main loop can update every sprite at once. Rows of removed sprites go on a
+# free list and are handed to the next new sprite.
+_phys = {
+    name: np.zeros(64, dtype) for name, dtype in (
+        ('x', np.float64), ('y', np.float64), ('w', np.float64), ('h', np.float64),
+        ('vx', np.float64), ('vy', np.float64), ('gravity', np.float64),
+        ('age', np.float64), ('lifetime', np.float64),
+        ('alive', np.bool_), ('has_gravity', np.bool_),
+        ('bounce', np.bool_), ('on_ground', np.bool_),
+    )
+}
+_phys_count = 0    # rows [0, _phys_count) have been handed out
+_phys_free  = []   # released rows below _phys_count, reused first
+
+def _phys_alloc():
+    """Reserve a cleared physics row, doubling the arrays when full."""
+    global _phys_count
+    if _phys_free:
+        i = _phys_free.pop()
+    else:
+        i = _phys_count
+        if i == len(_phys['x']):
+            for name, arr in _phys.items():
+                grown = np.zeros(2 * len(arr), arr.dtype)
+                grown[:i] = arr
+                _phys[name] = grown
+        _phys_count += 1
+    for arr in _phys.values():
+        arr[i] = 0
+    _phys['alive'][i]    = True
+    _phys['lifetime'][i] = np.inf
+    return i
+
+def _phys_release(sprites):
+    """
+    Put the rows of removed sprites on the free list. Each sprite keeps its
+    last values in a detached snapshot (sprite._store), so reading or
+    setting them later never touches a row another sprite now owns.
+    """
+    rows = np.fromiter((spr._row for spr in sprites), np.intp, len(sprites))
+    snapshot = {name: arr[rows] for name, arr in _phys.items()}
+    snapshot['alive'][:] = False
+    _phys['alive'][rows] = False
+    _phys_free.extend(rows.tolist())
+    for k, spr in enumerate(sprites):
+        spr._store, spr._row = snapshot, k
+
+def _phys_compact(sprites):
+    """Pack the rows of `sprites` to the front of the arrays, in list order."""
+    global _phys_count
+    rows = np.fromiter((spr._row for spr in sprites), np.intp, len(sprites))
+    for arr in _phys.values():
+        arr[:len(rows)] = arr[rows]
+    for i, spr in enumerate(sprites):
+        spr._row = i
+    _phys_count = len(rows)
+    _phys_free.clear()
+
+def _phys_reset(sprites):
+    """Release every row (game restart)."""
+    global _phys_count
+    _phys_release(sprites)
+    _phys['alive'][:] = False
+    _phys_count = 0
+    _phys_free.clear()
+
+def _phys_field(name):
+    """Sprite attribute stored in the sprite's physics row."""
+    def get(self):
+        return self._store[name][self._row].item()
+    def set(self, value):
+        self._store[name][self._row] = value
+    return property(get, set)
+
+def _round_like_rect(a, tmp, where):
+    """Round a[where] in place the way pygame.Rect rounds (half away from 0)."""
+    np.abs(a, out=tmp)
+    tmp += 0.5
+    np.floor(tmp, out=tmp)
+    np.copysign(tmp, a, out=a, where=where)
+
+def _step_physics(n, dt, width, height, plats):
+    """
+    Gravity, movement, edge bounce, platforms and lifetime for rows [:n].
+    plats is this frame's (P, 4) snapshot of the platform rects.
+    """
+    if njit is None:
+        _step_physics_numpy(n, dt, width, height, plats)
+        return
+    p = _phys
+    _step_physics_loop(
+        p['x'][:n], p['y'][:n], p['w'][:n], p['h'][:n], p['vx'][:n], p['vy'][:n],
+        p['gravity'][:n], p['age'][:n], p['lifetime'][:n], p['alive'][:n],
+        p['has_gravity'][:n], p['bounce'][:n], p['on_ground'][:n],
+        plats, dt, width, height)
+
+def _step_physics_loop(x, y, w, h, vx, vy, gravity, age, lifetime, alive,
+                       has_gravity, bounce, on_ground, plats, dt, width, height):
+    """Same pass as _step_physics_numpy, one sprite at a time (for Numba)."""
+    for i in range(len(x)):
+        if not alive[i]:   # free row
+            continue
+
+        # gravity and movement, rounded like pygame.Rect
+        vy[i] += gravity[i] * dt
+        v = x[i] + vx[i] * dt
+        x[i] = math.copysign(math.floor(abs(v) + 0.5), v)
+        v = y[i] + vy[i] * dt
+        y[i] = math.copysign(math.floor(abs(v) + 0.5), v)
+
+        # edge bounce
+        if bounce[i]:
+            if x[i] < 0 or x[i] + w[i] > width:
+                vx[i] = -vx[i]
+                x[i] = max(0.0, min(x[i], width - w[i]))
+            if y[i] < 0 or y[i] + h[i] > height:
+                vy[i] = -vy[i]
+                y[i] = max(0.0, min(y[i], height - h[i]))
+
+        # platforms (land from above on the first one touched)
+        if has_gravity[i] and vy[i] >= 0:
+            on_ground[i] = False
+            if w[i] != 0 and h[i] != 0:
+                # edges as colliderect sees them: negative sizes flip
+                left, right = min(x[i], x[i] + w[i]), max(x[i], x[i] + w[i])
+                top, bottom = min(y[i], y[i] + h[i]), max(y[i], y[i] + h[i])
+                for k in range(len(plats)):
+                    px, py, pw, ph = plats[k, 0], plats[k, 1], plats[k, 2], plats[k, 3]
+                    if (pw != 0 and ph != 0
+                            and left < max(px, px + pw) and right > min(px, px + pw)
+                            and top < max(py, py + ph) and bottom > min(py, py + ph)):
+                        y[i] = py - h[i]
+                        vy[i] = 0.0
+                        on_ground[i] = True
+                        break
+
+        # lifetime
+        age[i] += dt
+        if age[i] >= lifetime[i]:
+            alive[i] = False
+
+if njit is not None:
+    # No fastmath: lifetime uses inf, and results must match the NumPy pass.
+    _step_physics_loop = njit(cache=True)(_step_physics_loop)
+
+def _step_physics_numpy(n, dt, width, height, plats):
+    """
+    Vectorized physics pass over the live rows in [:n]. Works in place with
+    one temporary row and masked ufuncs, so no per-step temporaries or
+    fancy-index copies; free rows are left untouched.
+    """
+    x, y   = _phys['x'][:n], _phys['y'][:n]
+    w, h   = _phys['w'][:n], _phys['h'][:n]
+    vx, vy = _phys['vx'][:n], _phys['vy'][:n]
+    live   = _phys['alive'][:n].copy()
+
+    # gravity (0 for sprites without it) and movement
+    tmp = np.multiply(_phys['gravity'][:n], dt)
+    np.add(vy, tmp, out=vy, where=live)
+    np.multiply(vx, dt, out=tmp)
+    np.add(x, tmp, out=x, where=live)
+    np.multiply(vy, dt, out=tmp)
+    np.add(y, tmp, out=y, where=live)
+    _round_like_rect(x, tmp, live)
+    _round_like_rect(y, tmp, live)
+
+    # edge bounce: flip and clamp just the masked rows
+    bounce = _phys['bounce'][:n] & live
+    for pos, vel, size, limit in ((x, vx, w, width), (y, vy, h, height)):
+        np.add(pos, size, out=tmp)
+        m  = tmp > limit
+        m |= pos < 0
+        m &= bounce
+        np.negative(vel, out=vel, where=m)
+        np.subtract(limit, size, out=tmp)
+        np.minimum(pos, tmp, out=pos, where=m)
+        np.maximum(pos, 0, out=pos, where=m)
+
+    # platforms (land from above on the first one touched)
+    falling = np.flatnonzero(_phys['has_gravity'][:n] & live & (vy >= 0))
+    _phys['on_ground'][falling] = False
+    if len(plats) and len(falling):
+        touch  = _touching(np.column_stack((x[falling], y[falling],
+                                            w[falling], h[falling])), plats)
+        landed = touch.any(axis=1)
+        rows   = falling[landed]
+        y[rows]  = plats[touch[landed].argmax(axis=1), 1] - h[rows]
+        vy[rows] = 0
+        _phys['on_ground'][rows] = True
+
+    # lifetime (inf for sprites without one)
+    age = _phys['age'][:n]
+    np.add(age, dt, out=age, where=live)
+    _phys['alive'][:n] &= age < _phys['lifetime'][:n]
+
+def _update_physics(dt, width, height):
+    """
+    One frame of physics: follow, gravity, movement, bounce, platforms,
+    lifetime. Followers steer toward where their target is at the start of
+    the frame, before the batched step moves anything.
+    """
+    removed = False
+    for spr in _sprites:   # not mutated here; dead ones are swept below
+        if not spr.alive:
+            removed = True
+            continue
+
+        # follow
+        if spr._follow:
+            targ, spd = spr._follow
+            cx, cy = spr.rect.center
+            tx, ty = targ.rect.center
+            dx, dy = tx - cx, ty - cy
+            dist = math.hypot(dx, dy)
+            if dist > 0:
+                spr.rect.x += dx / dist * spd * dt
+                spr.rect.y += dy / dist * spd * dt
+
+    if removed:
+        # one sweep instead of an O(N) list.remove() per dead sprite
+        _phys_release([spr for spr in _sprites if not spr.alive])
+        _sprites[:] = [spr for spr in _sprites if spr.alive]
+        if len(_phys_free) > len(_sprites):
+            _phys_compact(_sprites)   # mostly holes: pack the rows again
+
+    if _sprites:
+        # rects/speeds -> arrays, step everything at once, arrays -> rects/speeds
+        rows   = np.fromiter((spr._row for spr in _sprites), np.intp, len(_sprites))
+        rects  = _rect_array(_sprites)
+        speeds = np.array([spr.speed for spr in _sprites], np.float64)
+        for col, name in enumerate(('x', 'y', 'w', 'h')):
+            _phys[name][rows] = rects[:, col]
+        _phys['vx'][rows] = speeds[:, 0]
+        _phys['vy'][rows] = speeds[:, 1]
+        _step_physics(_phys_count, dt, width, height, _rect_array(_platforms))
+        xs, ys = _phys['x'][rows].tolist(), _phys['y'][rows].tolist()
+        vxs    = _phys['vx'][rows].tolist()
+        vys    = _phys['vy'][rows].tolist()
+        alive  = _phys['alive'][rows].tolist()
+        for spr, x, y, vx, vy, a in zip(_sprites, xs, ys, vxs, vys, alive):
+            spr.rect.x  = x
+            spr.rect.y  = y
+            spr.speed.x = vx
+            spr.speed.y = vy
+            if not a:
+                spr.destroy()
+
 # ——— Sprite classes ———
 class Sprite:
     def __init__(self, image, rect, color):
@@ -103,15 +520,36 @@ class Sprite:
         self.color = color
 
 class GameSprite(Sprite):
+    bounce    = _phys_field('bounce')
+    on_ground = _phys_field('on_ground')
+
     def __init__(self, image, rect, color, speed=(0,0), lifetime=None):
         super().__init__(image, rect, color)
+        self._store   = _phys   # physics arrays holding this sprite's row
+        self._row     = _phys_alloc()
         self.speed    = pygame.Vector2(speed)
         self.lifetime = lifetime
-        self._age     = 0.0
         self._follow  = None
-        self.bounce   = False
         self.alive    = True
 
+    @property
+    def lifetime(self):
+        t = self._store['lifetime'][self._row]
+        return None if np.isinf(t) else t.item()
+
+    @lifetime.setter
+    def lifetime(self, value):
+        self._store['lifetime'][self._row] = np.inf if value is None else value
+
+    @property
+    def gravity(self):
+        return self._store['gravity'][self._row].item()
+
+    @gravity.setter
+    def gravity(self, value):
+        self._store['gravity'][self._row]     = value
+        self._store['has_gravity'][self._row] = True
+
     def set_speed(self, dx, dy):
         self.speed = pygame.Vector2(dx, dy)
 
@@ -120,7 +558,10 @@ class GameSprite(Sprite):
         self.set_speed(dx, dy)
 
     def follow(self, target, speed):
-        """Move toward target at given speed (px/sec)."""
+        """
+        Move toward target at given speed (px/sec), aiming at where the
+        target is at the start of each frame.
+        """
         self._follow = (target, speed)
 
     def set_bounce(self, enable=True):
@@ -141,8 +582,11 @@ def sprite(image_path=None, x=100, y=100, width=50, height=50,
     if image_path:
         try:
             image = _image_cache.get((image_path, width, height))
-            if not image:
-                raw = pygame.image.load(image_path).convert_alpha()
+            if image is None:
+                raw = _raw_image_cache.get(image_path)
+                if raw is None:
+                    raw = pygame.image.load(image_path).convert_alpha()
+                    _raw_image_cache[image_path] = raw
                 image = pygame.transform.smoothscale(raw, (width, height))
                 _image_cache[(image_path, width, height)] = image
         except Exception:
@@ -155,8 +599,13 @@ def sprite(image_path=None, x=100, y=100, width=50, height=50,
 
 def when_key(key_name, fn):
     """Call fn() every frame while key is held."""
-    code = pygame.key.key_code(key_name)
+    code = _key_code_cache.get(key_name)
+    if code is None:
+        code = pygame.key.key_code(key_name)
+        _key_code_cache[key_name] = code
     _key_handlers.setdefault(code, []).append(fn)
+    _key_handlers_flat[:] = [(c, f) for c, fns in _key_handlers.items()
+                                    for f in fns]
 
 def when_click(sprite_obj, fn):
     """Call fn() when the sprite is clicked."""
@@ -181,20 +630,27 @@ def control_arrows(sprite, speed=200, bounds=None):
     Arrow-key movement at `speed` px/sec. Optional bounds=(x0,y0,x1,y1).
     """
     sprite.control_speed = speed
+    # Bind the key codes, get_pressed and bounds once, as closure locals.
+    # speed and rect are re-read each frame: games may change them.
+    get_pressed = pygame.key.get_pressed
+    K_LEFT, K_RIGHT = pygame.K_LEFT, pygame.K_RIGHT
+    K_UP, K_DOWN    = pygame.K_UP, pygame.K_DOWN
+    if bounds:
+        x0, y0, x1, y1 = bounds
     def handler(dt):
-        spd = sprite.control_speed
-        pressed = pygame.key.get_pressed()
+        step = sprite.control_speed * dt
+        pressed = get_pressed()
         dx = dy = 0.0
-        if pressed[pygame.K_LEFT]:  dx -= spd * dt
-        if pressed[pygame.K_RIGHT]: dx += spd * dt
-        if pressed[pygame.K_UP]:    dy -= spd * dt
-        if pressed[pygame.K_DOWN]:  dy += spd * dt
-        sprite.rect.x += dx
-        sprite.rect.y += dy
+        if pressed[K_LEFT]:  dx -= step
+        if pressed[K_RIGHT]: dx += step
+        if pressed[K_UP]:    dy -= step
+        if pressed[K_DOWN]:  dy += step
+        rect = sprite.rect
+        rect.x += dx
+        rect.y += dy
         if bounds:
-            x0,y0,x1,y1 = bounds
-            sprite.rect.x = max(x0, min(sprite.rect.x, x1 - sprite.rect.width))
-            sprite.rect.y = max(y0, min(sprite.rect.y, y1 - sprite.rect.height))
+            rect.x = max(x0, min(rect.x, x1 - rect.width))
+            rect.y = max(y0, min(rect.y, y1 - rect.height))
     on_game_update(handler)
 
 def projectile_from(sprite_obj, vx, vy,
@@ -210,13 +666,16 @@ def projectile_from(sprite_obj, vx, vy,
 
 # ——— Main loop ———
 def start(width, height, title):
-    global _screen, _clock, _sprites, _game_over_flag
+    global _screen, _clock, _sprites, _game_over_flag, _full_redraw
 
     pygame.init()
     _screen = pygame.display.set_mode((width, height))
     pygame.display.set_caption(title)
+    # Zero-row physics step: compiles the Numba kernel (if any) now, so the
+    # first frame doesn't stall and hand the game a huge dt.
+    _step_physics(0, 0.0, width, height, _rect_array(()))
     _clock  = pygame.time.Clock()
-    font_cache = {}
+    last_drawn = []   # screen rects drawn last frame
 
     # Prepare background now that display exists
     _prepare_background(width, height)
@@ -234,9 +693,13 @@ def start(width, height, title):
             if event.type == pygame.QUIT:
                 running = False
 
+            elif event.type in _REDRAW_EVENTS:
+                _full_redraw = True
+
             elif event.type == pygame.KEYDOWN:
                 if _game_over_flag and event.key == pygame.K_SPACE:
                     # reset state (keep handlers)
+                    _phys_reset(_sprites)
                     _sprites.clear()
                     _draw_commands.clear()
                     _text_commands.clear()
@@ -255,92 +718,33 @@ def start(width, height, title):
         # Game-over screen
         if _game_over_flag:
             # draw background behind overlay
-            if _background_surface:
-                if _background_mode == 'stretch':
-                    _screen.blit(_background_surface, (0,0))
-                else:  # tile
-                    iw, ih = _background_surface.get_size()
-                    for yy in range(0, height, ih):
-                        for xx in range(0, width, iw):
-                            _screen.blit(_background_surface, (xx, yy))
-            else:
-                _screen.fill(_background_color)
+            _draw_background()
 
-            font1 = pygame.font.Font(None, 64)
-            txt1 = font1.render(_game_over_msg, True, (255,50,50))
+            txt1 = _text_surface(_game_over_msg, 64, (255,50,50))
             _screen.blit(txt1, ((width-txt1.get_width())//2, height//2-80))
-            font2 = pygame.font.Font(None, 32)
-            txt2 = font2.render("Press SPACE to Restart", True, (200,200,200))
+            txt2 = _text_surface("Press SPACE to Restart", 32, (200,200,200))
             _screen.blit(txt2, ((width-txt2.get_width())//2, height//2+10))
             pygame.display.flip()
+            _full_redraw = True
             continue
 
         # Continuous key handlers
         pressed = pygame.key.get_pressed()
-        for code, fns in _key_handlers.items():
+        for code, fn in _key_handlers_flat:
             if pressed[code]:
-                for fn in fns:
-                    fn()
+                fn()
 
         # on_game_update hooks
         for fn in _game_update_handlers:
             fn(dt)
 
-        # Physics: follow, gravity, movement, bounce, platforms, lifetime
-        for spr in list(_sprites):
-            if not isinstance(spr, GameSprite):
-                continue
-            if not spr.alive:
-                _sprites.remove(spr)
-                continue
-
-            # follow
-            if spr._follow:
-                targ, spd = spr._follow
-                dirv = (pygame.Vector2(targ.rect.center)
-                        - pygame.Vector2(spr.rect.center))
-                if dirv.length() > 0:
-                    vel = dirv.normalize() * spd * dt
-                    spr.rect.x += vel.x
-                    spr.rect.y += vel.y
-
-            # gravity
-            if hasattr(spr, 'gravity'):
-                spr.speed.y += spr.gravity * dt
-
-            # movement
-            spr.rect.x += spr.speed.x * dt
-            spr.rect.y += spr.speed.y * dt
-
-            # edge bounce
-            if spr.bounce:
-                if spr.rect.left < 0 or spr.rect.right > width:
-                    spr.speed.x *= -1
-                    spr.rect.x = max(0, min(spr.rect.x, width - spr.rect.width))
-                if spr.rect.top < 0 or spr.rect.bottom > height:
-                    spr.speed.y *= -1
-                    spr.rect.y = max(0, min(spr.rect.y, height - spr.rect.height))
-
-            # platforms (land from above)
-            if hasattr(spr, 'gravity') and spr.speed.y >= 0:
-                spr.on_ground = False
-                for plat in _platforms:
-                    if spr.rect.colliderect(plat.rect):
-                        spr.rect.bottom = plat.rect.top
-                        spr.speed.y = 0
-                        spr.on_ground = True
-                        break
-
-            # lifetime
-            if spr.lifetime is not None:
-                spr._age += dt
-                if spr._age >= spr.lifetime:
-                    spr.destroy()
+        _update_physics(dt, width, height)
 
         # overlap events
-        for a, b, fn in _overlap_handlers:
-            if a.alive and b.alive and a.rect.colliderect(b.rect):
-                fn(a, b)
+        for group_a, group_b, fn in _overlap_handlers:
+            for a, b in overlaps(group_a, group_b):
+                if a.alive and b.alive:   # fn may destroy sprites
+                    fn(a, b)
 
         # when_update hooks
         for fn in _update_handlers:
@@ -348,36 +752,32 @@ def start(width, height, title):
 
         # — Drawing —
         # Background first
-        if _background_surface:
-            if _background_mode == 'stretch':
-                _screen.blit(_background_surface, (0,0))
-            else:  # tile
-                iw, ih = _background_surface.get_size()
-                for yy in range(0, height, ih):
-                    for xx in range(0, width, iw):
-                        _screen.blit(_background_surface, (xx, yy))
-        else:
-            _screen.fill(_background_color)
+        _draw_background()
 
-        # Sprites
-        for spr in _sprites:
-            if spr.image:
-                _screen.blit(spr.image, spr.rect)
-            else:
-                pygame.draw.rect(_screen, spr.color, spr.rect)
+        # Sprites (one batched blit, in draw order). Like draw.rect, colored
+        # sprites with a zero or negative size draw nothing.
+        drawn = _screen.blits([(spr.image or _color_surface(spr.color, spr.rect.size),
+                                spr.rect) for spr in _sprites
+                               if spr.image or (spr.rect.w > 0 and spr.rect.h > 0)])
 
         # Circles
         for _, x, y, r in _draw_commands:
-            pygame.draw.circle(_screen, (255,255,255), (x, y), r)
+            drawn.append(pygame.draw.circle(_screen, (255,255,255), (x, y), r))
 
         # Text
         for text, x, y, size in _text_commands:
-            f = font_cache.get(size) or pygame.font.Font(None, size)
-            font_cache[size] = f
-            surf = f.render(text, True, (255,255,255))
-            _screen.blit(surf, (x, y))
+            surf = _text_surface(text, size)
+            drawn.append(_screen.blit(surf, (x, y)))
 
-        pygame.display.flip()
+        # Present only what changed: where things were last frame and where
+        # they are now (the background itself is static).
+        dirty = last_drawn + drawn
+        if _full_redraw or len(dirty) > _DIRTY_RECTS_MAX:
+            pygame.display.flip()
+            _full_redraw = False
+        else:
+            pygame.display.update(dirty)
+        last_drawn = drawn
         _draw_commands.clear()
         _text_commands.clear()
 
@@ -0,0 +1,196 @@
+import copy
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pytest
+
+import playkit
+
+
+@pytest.fixture(autouse=True)
+def fresh_sprites():
+    """Each test starts and ends with no sprites and no used physics rows."""
+    def reset():
+        playkit._phys_reset(playkit._sprites)
+        playkit._sprites.clear()
+        playkit._overlap_handlers.clear()
+    reset()
+    yield
+    reset()
+
+
+def test_speed_in_place_edits_stick():
+    s = playkit.sprite(speed=(10, 20))
+    s.speed.y = -400
+    s.speed.x *= -1
+    assert list(s.speed) == [-10, -400]
+
+
+def test_speed_augmented_assignment_and_setter():
+    s = playkit.sprite(speed=(1, 2))
+    s.speed += (3, 4)
+    assert s.speed == (4, 6)
+    s.speed = (7, 8)
+    s.velocity(5, -5)
+    assert (s.speed.x, s.speed.y) == (5, -5)
+    assert s.speed.length() == playkit.pygame.Vector2(5, -5).length()
+
+
+def test_speed_is_a_real_vector2():
+    s = playkit.sprite(speed=(3, 4))
+    v = s.speed
+    v.scale_to_length(10)
+    assert s.speed == (6, 8)
+    s.speed.rotate_ip(90)
+    s.speed.update(1, 2)
+    s.speed.xy = (s.speed.y, s.speed.x)
+    assert v == (2, 1) and isinstance(s.speed, playkit.pygame.Vector2)
+    saved = copy.copy(s.speed)
+    s.speed.x = 50
+    assert saved == (2, 1)
+
+
+def test_color_surface_cache_is_bounded():
+    playkit.pygame.init()
+    playkit._screen = playkit.pygame.display.set_mode((64, 64))
+    for k in range(playkit._COLOR_CACHE_MAX + 50):
+        playkit._color_surface((k % 256, k // 256, 0), (4, 4))
+    assert len(playkit._color_surf_cache) == playkit._COLOR_CACHE_MAX
+
+
+def test_control_arrows_follows_a_replaced_rect(monkeypatch):
+    pressed = {playkit.pygame.K_RIGHT}
+    monkeypatch.setattr(playkit.pygame.key, 'get_pressed',
+                        lambda: type('P', (), {'__getitem__': lambda _, k: k in pressed})())
+    monkeypatch.setattr(playkit, '_game_update_handlers', [])
+    s = playkit.sprite(x=0, y=0, width=10, height=10)
+    playkit.control_arrows(s, speed=100)
+    s.rect = playkit.pygame.Rect(50, 0, 10, 10)
+    playkit._game_update_handlers[0](0.5)
+    assert s.rect.x == 100
+
+
+def test_removed_sprites_keep_their_own_physics_values():
+    a = playkit.sprite(lifetime=3)
+    b = playkit.sprite()
+    a.gravity, b.gravity = 1, 5
+    a.destroy()
+    playkit._update_physics(0.0, 640, 480)   # sweeps a off the live rows
+    b.destroy()
+    playkit._update_physics(0.0, 640, 480)
+    assert playkit._sprites == []
+    a.gravity = 99
+    assert b.gravity == 5
+    assert a.gravity == 99 and a.lifetime == 3
+    c = playkit.sprite(lifetime=7)   # reuses a freed row
+    c.gravity = 8
+    assert (a.gravity, a.lifetime) == (99, 3) and (c.gravity, c.lifetime) == (8, 7)
+
+
+def test_games_can_use_their_own_i_attribute():
+    a = playkit.sprite(lifetime=3)
+    b = playkit.sprite(lifetime=5)
+    a.i = b.i = 0
+    assert (a.lifetime, b.lifetime) == (3, 5)
+
+
+def test_follow_aims_at_the_targets_start_of_frame_position(monkeypatch):
+    monkeypatch.setattr(playkit, '_sprites', [])
+    monkeypatch.setattr(playkit, '_platforms', [])
+    chaser = playkit.sprite(x=0, y=0, width=10, height=10)
+    target = playkit.sprite(x=100, y=0, width=10, height=10, speed=(0, 100))
+    chaser.follow(target, speed=10)
+    for order in ([chaser, target], [target, chaser]):
+        chaser.rect.topleft, target.rect.topleft = (0, 0), (100, 0)
+        playkit._sprites[:] = order
+        playkit._update_physics(1.0, 1000, 1000)
+        assert chaser.rect.topleft == (10, 0) and target.rect.topleft == (100, 100)
+
+
+def test_color_surface_accepts_any_pygame_color():
+    playkit.pygame.init()
+    playkit._screen = playkit.pygame.display.set_mode((64, 64))
+    for color in (0xFF8800, 'orange', [255, 136, 0], playkit.pygame.Color(255, 136, 0)):
+        surf = playkit._color_surface(color, (2, 2))
+        expected = playkit.pygame.Surface((2, 2)).convert()
+        playkit.pygame.draw.rect(expected, color, (0, 0, 2, 2))
+        assert surf.get_at((0, 0)) == expected.get_at((0, 0))
+    assert (playkit._color_surface([255, 136, 0], (2, 2))
+            is playkit._color_surface((255, 136, 0), (2, 2)))
+
+
+def test_overlaps_skips_self_and_dedupes_one_group(monkeypatch):
+    balls = [playkit.sprite(x=k, y=0, width=10, height=10) for k in range(0, 40, 5)]
+    expected = {(a, b) for k, a in enumerate(balls) for b in balls[k + 1:]
+                if a.rect.colliderect(b.rect)}
+    for pair_max, broadcast_max in ((10**9, 10**9), (0, 10**9), (0, 0)):
+        monkeypatch.setattr(playkit, '_PAIR_LOOP_MAX', pair_max)
+        monkeypatch.setattr(playkit, '_BROADCAST_MAX', broadcast_max)
+        pairs = playkit.overlaps(balls, balls)
+        assert len(pairs) == len(expected) and set(pairs) == expected
+        assert all(a is not b for a, b in playkit.overlaps(balls, list(balls)))
+        assert len(playkit.overlaps(balls, list(balls))) == 2 * len(expected)
+
+
+def test_when_overlap_accepts_sets():
+    a = playkit.sprite(x=0, y=0, width=10, height=10)
+    b = playkit.sprite(x=5, y=5, width=10, height=10)
+    playkit.when_overlap({a}, {b}, lambda x, y: None)
+    group_a, group_b, _ = playkit._overlap_handlers.pop()
+    assert playkit.overlaps(group_a, group_b) == [(a, b)]
+
+
+def test_overlap_tiers_match_colliderect_with_negative_sizes(monkeypatch):
+    rng = random.Random(3)
+    def group(n):
+        sprites = [playkit.sprite() for _ in range(n)]
+        for s in sprites:
+            s.rect = playkit.pygame.Rect(rng.randint(-50, 300), rng.randint(-50, 300),
+                                         rng.randint(-80, 80), rng.randint(-80, 80))
+        return sprites
+    group_a, group_b = group(40), group(50)
+    expected = [(a, b) for a in group_a for b in group_b if a.rect.colliderect(b.rect)]
+    for pair_max, broadcast_max in ((10**9, 10**9), (0, 10**9), (0, 0)):
+        monkeypatch.setattr(playkit, '_PAIR_LOOP_MAX', pair_max)
+        monkeypatch.setattr(playkit, '_BROADCAST_MAX', broadcast_max)
+        assert playkit.overlaps(group_a, group_b) == expected
+
+
+def test_compiled_loop_and_numpy_step_agree(monkeypatch):
+    rng = np.random.default_rng(4)
+    n = 300
+    rows = {
+        'x': rng.integers(-40, 700, n).astype(float),
+        'y': rng.integers(-40, 500, n).astype(float),
+        'w': rng.integers(-20, 40, n).astype(float),
+        'h': rng.integers(-20, 40, n).astype(float),
+        'vx': rng.uniform(-600, 600, n),
+        'vy': rng.uniform(-600, 600, n),
+        'gravity': np.where(rng.random(n) < 0.5, rng.uniform(0, 900, n), 0.0),
+        'age': rng.uniform(0, 1, n),
+        'lifetime': np.where(rng.random(n) < 0.3, rng.uniform(0, 2, n), np.inf),
+        'alive': rng.random(n) < 0.8,   # the rest are free rows
+        'bounce': rng.random(n) < 0.5,
+        'on_ground': rng.random(n) < 0.5,
+    }
+    rows['has_gravity'] = rows['gravity'] > 0
+    plats = np.column_stack((rng.integers(0, 640, 8), rng.integers(0, 480, 8),
+                             rng.integers(-200, 200, 8), rng.integers(-30, 30, 8))).astype(float)
+    by_numpy = {name: arr.copy() for name, arr in rows.items()}
+    by_loop  = {name: arr.copy() for name, arr in rows.items()}
+    monkeypatch.setattr(playkit, '_phys', by_numpy)
+    for _ in range(120):
+        playkit._step_physics_numpy(n, 1 / 60, 640, 480, plats)
+        playkit._step_physics_loop(
+            *(by_loop[name] for name in ('x', 'y', 'w', 'h', 'vx', 'vy', 'gravity',
+                                         'age', 'lifetime', 'alive', 'has_gravity',
+                                         'bounce', 'on_ground')),
+            plats, 1 / 60, 640, 480)
+    for name in rows:
+        np.testing.assert_array_equal(by_numpy[name], by_loop[name], err_msg=name)
+    assert by_loop['on_ground'].any() and (rows['alive'] & ~by_loop['alive']).any()
+    free = ~rows['alive']
+    assert np.array_equal(by_loop['x'][free], rows['x'][free])